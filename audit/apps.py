@@ -24,14 +24,20 @@ class AuditConfig(AppConfig):
         # Ejecutar init_audit_models automaticamente despues de cada migrate
         post_migrate.connect(init_audit_models_after_migrate, sender=self)
 
-        # Re-registrar todos los modelos con serialize_data=True
+        # Registro unico de todos los modelos (AUDITLOG_INCLUDE_ALL_MODELS=False):
+        # mismo criterio que auditlog.register_from_settings pero con
+        # serialize_data=True y sin m2m_fields. Los cambios M2M no emiten
+        # post_log y no pasarian por el filtro de AuditModelConfig.
+        from django.apps import apps
         from auditlog.registry import auditlog
 
-        registered_models = list(auditlog.get_models())
-
-        for model in registered_models:
-            try:
-                auditlog.unregister(model)
-                auditlog.register(model, serialize_data=True)
-            except Exception:
-                pass
+        for model in apps.get_models(include_auto_created=True):
+            # DEFAULT_EXCLUDE_MODELS: los LogEntry de auditlog y del admin
+            if model._meta.label in auditlog.DEFAULT_EXCLUDE_MODELS or not model._meta.managed:
+                continue
+            exclude_fields = [
+                rel.related_name
+                for rel in model._meta.related_objects
+                if rel.related_name and not rel.related_model._meta.managed
+            ]
+            auditlog.register(model, serialize_data=True, exclude_fields=exclude_fields)
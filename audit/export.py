@@ -0,0 +1,149 @@
+import gzip
+import json
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from auditlog.models import LogEntry
+from django.utils import timezone
+
+from store.renderers import dumps
+
+
+EXPORT_FIELDS = [
+    'id',
+    'timestamp',
+    'action',
+    'content_type_id',
+    'content_type__app_label',
+    'content_type__model',
+    'object_pk',
+    'object_id',
+    'object_repr',
+    'changes',
+    'serialized_data',
+    'actor_id',
+    'actor_email',
+    'remote_addr',
+    'remote_port',
+    'cid',
+    'additional_data',
+]
+
+FORMATS = {
+    'ndjson': 'ndjson.gz',
+    'columnar': 'columnar.jsonl.gz',
+}
+
+
+class AuditLogExporter:
+    """
+    Exporta LogEntry a archivos append-only comprimidos (gzip) por marca de agua de id.
+
+    - Cada lote se agrega como un miembro gzip al archivo actual.
+    - Al superar `max_bytes` se rota a un archivo nuevo (nombrado por el primer id).
+    - El estado (ultimo id exportado, archivo actual y bytes confirmados) se
+      guarda en `state.json` despues de cada lote, por lo que el proceso se
+      puede reiniciar.
+
+    Formatos:
+    - ndjson: una linea JSON por LogEntry.
+    - columnar: una linea JSON por lote con los valores agrupados por columna.
+    Si el proceso se corta a mitad de un lote, al reiniciar el archivo actual se
+    trunca al ultimo offset confirmado y el lote se vuelve a escribir completo,
+    asi que los archivos nunca quedan con un miembro gzip a medias.
+
+    Los id se asignan al insertar pero las filas se ven al hacer commit: una
+    transaccion con un id menor puede confirmarse despues de exportar uno mayor
+    y la marca de agua la saltaria. Por eso cada lote se corta en el primer
+    LogEntry con menos de `lag_seconds` de antiguedad y se espera a la
+    siguiente corrida.
+    """
+
+    def __init__(self, directory, fmt='ndjson', batch_size=5000, max_bytes=64 * 1024 * 1024,
+                 using='default', lag_seconds=60):
+        self.directory = Path(directory)
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self.using = using
+        self.lag_seconds = lag_seconds
+        self.state_path = self.directory / 'state.json'
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.state = self.load_state()
+        self.discard_uncommitted()
+
+    def load_state(self):
+        if self.state_path.exists():
+            return json.loads(self.state_path.read_text())
+        return {'last_id': 0, 'current_file': None, 'offset': 0}
+
+    def discard_uncommitted(self):
+        """Trunca el archivo actual al ultimo offset confirmado en state.json."""
+        current = self.state['current_file']
+        if not current or 'offset' not in self.state:
+            return
+        path = self.directory / current
+        if path.exists() and path.stat().st_size > self.state['offset']:
+            with open(path, 'r+b') as f:
+                f.truncate(self.state['offset'])
+                os.fsync(f.fileno())
+
+    def save_state(self):
+        tmp_path = self.state_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.state))
+        os.replace(tmp_path, self.state_path)
+
+    def fetch_batch(self):
+        rows = list(
+            LogEntry.objects.using(self.using)
+            .filter(id__gt=self.state['last_id'])
+            .order_by('id')
+            .values(*EXPORT_FIELDS)[:self.batch_size]
+        )
+        # Solo hasta el primer LogEntry dentro del margen: por debajo de su id
+        # aun puede haber transacciones sin confirmar
+        cutoff = timezone.now() - timedelta(seconds=self.lag_seconds)
+        for index, row in enumerate(rows):
+            if row['timestamp'] >= cutoff:
+                return rows[:index]
+        return rows
+
+    def encode(self, rows):
+        if self.fmt == 'columnar':
+            columns = {field: [row[field] for row in rows] for field in EXPORT_FIELDS}
+            return dumps({'count': len(rows), 'columns': columns}) + b'\n'
+        return b''.join(dumps(row) + b'\n' for row in rows)
+
+    def target_path(self, first_id):
+        current = self.state['current_file']
+        if current and current.endswith(FORMATS[self.fmt]):
+            path = self.directory / current
+            if path.exists() and path.stat().st_size < self.max_bytes:
+                return path
+        return self.directory / f'auditlog-{first_id:012d}.{FORMATS[self.fmt]}'
+
+    def write_batch(self, rows):
+        path = self.target_path(rows[0]['id'])
+        # Un archivo nuevo se abre truncando: puede existir a medias de una corrida cortada
+        mode = 'ab' if path.name == self.state['current_file'] else 'wb'
+        with open(path, mode) as f:
+            f.write(gzip.compress(self.encode(rows)))
+            f.flush()
+            os.fsync(f.fileno())
+            offset = f.tell()
+
+        self.state = {'last_id': rows[-1]['id'], 'current_file': path.name, 'offset': offset}
+        self.save_state()
+        return path
+
+    def export_pending(self):
+        """Exporta lotes hasta alcanzar el ultimo LogEntry. Devuelve cantidad exportada."""
+        total = 0
+        while True:
+            rows = self.fetch_batch()
+            if not rows:
+                return total
+            self.write_batch(rows)
+            total += len(rows)
@@ -0,0 +1,83 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from audit.export import FORMATS, AuditLogExporter
+
+
+class Command(BaseCommand):
+    help = 'Exporta LogEntry nuevos a archivos NDJSON/columnar comprimidos para analitica'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            default=str(getattr(settings, 'AUDIT_EXPORT_DIR', settings.BASE_DIR / 'exports' / 'audit')),
+            help='Directorio de salida (default: settings.AUDIT_EXPORT_DIR)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=sorted(FORMATS),
+            default='ndjson',
+            help='Formato de los archivos (default: ndjson)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='LogEntry por lote (default: 5000)'
+        )
+        parser.add_argument(
+            '--max-file-mb',
+            type=int,
+            default=64,
+            help='Tamano maximo por archivo antes de rotar (default: 64)'
+        )
+        parser.add_argument(
+            '--lag',
+            type=int,
+            default=60,
+            help='Segundos de antiguedad minima para exportar un LogEntry (default: 60)'
+        )
+        parser.add_argument(
+            '--database',
+            default='default',
+            help='Alias de base de datos a leer, p. ej. una replica (default: default)'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Seguir exportando en bucle esperando nuevos LogEntry'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=10,
+            help='Segundos de espera entre consultas en modo --loop (default: 10)'
+        )
+
+    def handle(self, *args, **options):
+        exporter = AuditLogExporter(
+            options['output'],
+            fmt=options['format'],
+            batch_size=options['batch_size'],
+            max_bytes=options['max_file_mb'] * 1024 * 1024,
+            using=options['database'],
+            lag_seconds=options['lag'],
+        )
+        self.stdout.write(f'Exportando desde id > {exporter.state["last_id"]} a {options["output"]}')
+
+        try:
+            while True:
+                exported = exporter.export_pending()
+                if exported:
+                    self.stdout.write(
+                        f'LogEntry exportados: {exported} (ultimo id: {exporter.state["last_id"]})'
+                    )
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING('Exportacion detenida'))
+
+        self.stdout.write(self.style.SUCCESS(f'Marca de agua: id {exporter.state["last_id"]}'))
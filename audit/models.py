@@ -8,5 +8,13 @@ class AuditModelConfig(models.Model):
     )
     is_active = models.BooleanField(default=True)
 
+    @classmethod
+    def is_active_for_model(cls, model):
+        """Indica si la auditoria esta activa para el modelo dado."""
+        return cls.objects.filter(
+            content_type=ContentType.objects.get_for_model(model),
+            is_active=True
+        ).exists()
+
     def __str__(self):
         return f"{self.content_type.app_label}.{self.content_type.model} - {self.is_active}"
\ No newline at end of file
@@ -7,14 +7,8 @@ def auditlog_post_log_handler(sender, **kwargs):
     if not log_entry:
         return
 
-    # ¿Existe config activa?
-    is_active = AuditModelConfig.objects.filter(
-        content_type=log_entry.content_type,
-        is_active=True
-    ).exists()
-
     # Si NO está activo → borrar log
-    if not is_active:
+    if not AuditModelConfig.is_active_for_model(log_entry.content_type.model_class()):
         log_entry.delete()
 
 post_log.connect(auditlog_post_log_handler)
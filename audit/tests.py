@@ -1,3 +1,111 @@
+import gzip
+import json
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from auditlog.models import LogEntry
 from django.test import TestCase
+from django.utils import timezone
+
+from audit.export import AuditLogExporter
+from audit.models import AuditModelConfig
+from inventory.models import Category, Product, Supplier
+
+
+class AuditRegistrationTests(TestCase):
+    def setUp(self):
+        category = Category.objects.create(name='C')
+        self.product = Product.objects.create(name='P', category=category, price='1.00', stock=1)
+        self.supplier = Supplier.objects.create(name='S', email='s@example.com', phone='1')
+
+    def test_m2m_change_not_logged_when_audit_inactive(self):
+        AuditModelConfig.objects.update(is_active=False)
+        before = LogEntry.objects.count()
+
+        self.product.suppliers.add(self.supplier)
+
+        self.assertEqual(LogEntry.objects.count(), before)
+
+    def test_active_model_logs_serialized_data(self):
+        AuditModelConfig.objects.update(is_active=True)
+
+        self.product.name = 'P2'
+        self.product.save()
+
+        entry = LogEntry.objects.get_for_object(self.product).latest('id')
+        self.assertIsNotNone(entry.serialized_data)
+
+
+class AuditLogExporterTests(TestCase):
+    def setUp(self):
+        AuditModelConfig.objects.update(is_active=True)
+        self.category = Category.objects.create(name='C')
+        self.directory = Path(tempfile.mkdtemp())
+
+    def exporter(self, **kwargs):
+        kwargs.setdefault('lag_seconds', 0)
+        return AuditLogExporter(self.directory, **kwargs)
+
+    def logged_ids(self):
+        return list(LogEntry.objects.order_by('id').values_list('id', flat=True))
+
+    def read_ids(self):
+        ids = []
+        for path in sorted(self.directory.glob('*.ndjson.gz')):
+            with gzip.open(path) as f:
+                ids.extend(json.loads(line)['id'] for line in f)
+        return ids
+
+    def test_restart_discards_partial_batch(self):
+        self.exporter(batch_size=10).export_pending()
+        state = json.loads((self.directory / 'state.json').read_text())
+
+        # Simular un corte a mitad de escribir un lote
+        current = self.directory / state['current_file']
+        partial = gzip.compress(b'{"id": 999}\n' * 100)
+        with open(current, 'ab') as f:
+            f.write(partial[:len(partial) // 2])
+
+        Product.objects.create(name='P', category=self.category, price='1.00', stock=1)
+        self.exporter(batch_size=10).export_pending()
+
+        ids = self.read_ids()
+        self.assertEqual(ids, self.logged_ids())
+
+    def test_rotates_files(self):
+        for i in range(5):
+            Product.objects.create(name=f'P{i}', category=self.category, price='1.00', stock=1)
+
+        self.exporter(batch_size=2, max_bytes=1).export_pending()
+
+        files = sorted(self.directory.glob('*.ndjson.gz'))
+        self.assertGreater(len(files), 1)
+        self.assertEqual(files[0].name, f'auditlog-{self.logged_ids()[0]:012d}.ndjson.gz')
+        self.assertEqual(self.read_ids(), self.logged_ids())
+
+    def test_columnar_format(self):
+        Product.objects.create(name='P', category=self.category, price='1.00', stock=1)
+
+        self.exporter(fmt='columnar', batch_size=1).export_pending()
+
+        ids = []
+        for path in self.directory.glob('*.columnar.jsonl.gz'):
+            with gzip.open(path) as f:
+                for line in f:
+                    batch = json.loads(line)
+                    self.assertEqual(batch['count'], len(batch['columns']['id']))
+                    ids.extend(batch['columns']['id'])
+        self.assertEqual(sorted(ids), self.logged_ids())
+
+    def test_recent_entries_wait_for_lag(self):
+        exporter = self.exporter(lag_seconds=60)
+        self.assertTrue(self.logged_ids())
+        self.assertEqual(exporter.export_pending(), 0)
+
+        later = timezone.now() + timedelta(seconds=61)
+        with mock.patch('audit.export.timezone.now', return_value=later):
+            exported = exporter.export_pending()
 
-# Create your tests here.
+        self.assertEqual(exported, len(self.logged_ids()))
@@ -1,22 +1,63 @@
 from django.contrib import admin
-from .models import Product, Category, Supplier
+from django.utils.text import capfirst
+from .models import Product, Category, Supplier, ProductSupplier, Customer
+
+
+class SoftDeleteAdmin(admin.ModelAdmin):
+    """
+    Pagina de confirmacion de borrado acorde al borrado logico.
+
+    El get_deleted_objects de Django usa el Collector (_base_manager): lista
+    como borradas filas que se conservan y cuenta los registros ya borrados
+    logicamente como protegidos. Aqui solo se marcan los objetos elegidos.
+    """
+
+    def get_protected_objects(self, objs):
+        return []
+
+    def get_deleted_objects(self, objs, request):
+        opts = self.model._meta
+        objs = list(objs)
+        deleted_objects = [f'{capfirst(opts.verbose_name)}: {obj}' for obj in objs]
+        model_count = {opts.verbose_name_plural: len(objs)}
+        perms_needed = set() if self.has_delete_permission(request) else {opts.verbose_name}
+        return deleted_objects, model_count, perms_needed, self.get_protected_objects(objs)
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(SoftDeleteAdmin):
     list_display = ('id', 'name')
     search_fields = ('name',)
 
+    def get_protected_objects(self, objs):
+        # Mismo criterio que Category.delete: solo cuentan los productos vivos
+        products = Product.objects.filter(category__in=objs)
+        return [f'{capfirst(Product._meta.verbose_name)}: {product}' for product in products]
+
+
+class ProductSupplierInline(admin.TabularInline):
+    model = ProductSupplier
+    extra = 1
+    autocomplete_fields = ('supplier',)
+
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
-    list_display = ('id', 'name', 'category', 'price', 'stock')
+class ProductAdmin(SoftDeleteAdmin):
+    list_display = ('id', 'name', 'category', 'price', 'stock', 'supplier_count')
     list_filter = ('category',)
+    list_select_related = ('category',)
     search_fields = ('name',)
-    filter_horizontal = ('suppliers',)
+    autocomplete_fields = ('category',)
+    inlines = (ProductSupplierInline,)
 
 
 @admin.register(Supplier)
-class SupplierAdmin(admin.ModelAdmin):
+class SupplierAdmin(SoftDeleteAdmin):
     list_display = ('id', 'name', 'email', 'phone', 'contact_person')
-    search_fields = ('name', 'email', 'contact_person')
\ No newline at end of file
+    search_fields = ('name', 'email', 'contact_person')
+
+
+@admin.register(Customer)
+class CustomerAdmin(SoftDeleteAdmin):
+    list_display = ('id', 'name', 'email', 'phone')
+    search_fields = ('name', 'email')
\ No newline at end of file
@@ -0,0 +1,69 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from store import renderers
+from store.renderers import FastJSONRenderer, iter_json_array
+
+
+class Command(BaseCommand):
+    help = 'Compara el tiempo de render JSON (DRF vs FastJSONRenderer vs streaming)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[1000, 10000, 100000],
+            help='Tamanos de payload a medir (default: 1000 10000 100000)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=3,
+            help='Repeticiones por medicion, se reporta la mejor (default: 3)'
+        )
+
+    def handle(self, *args, **options):
+        backend = 'orjson' if renderers.orjson is not None else 'stdlib'
+        self.stdout.write(f'FastJSONRenderer usando: {backend}')
+
+        for count in options['rows']:
+            rows = self.build_rows(count)
+            candidates = [
+                ('DRF JSONRenderer', lambda: JSONRenderer().render(rows)),
+                ('FastJSONRenderer', lambda: FastJSONRenderer().render(rows)),
+                ('Streaming (chunks)', lambda: sum(len(c) for c in iter_json_array(rows))),
+            ]
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f'{count} filas'))
+            for name, func in candidates:
+                elapsed = self.measure(func, options['repeat'])
+                self.stdout.write(f'  {name:<20} {elapsed * 1000:10.2f} ms')
+
+    def build_rows(self, count):
+        now = datetime.now(timezone.utc)
+        return [
+            {
+                'id': i,
+                'name': f'Producto {i}',
+                'category': i % 50,
+                'category_name': f'Categoria {i % 50}',
+                'price': Decimal('1500.00') + i,
+                'stock': i % 500,
+                'updated_at': now,
+            }
+            for i in range(count)
+        ]
+
+    def measure(self, func, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
@@ -0,0 +1,143 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+# Se ejecuta en un proceso nuevo (arranque en frio) con `python -X importtime`.
+# Mide django.setup(), el ready() de cada app y el registro de auditlog,
+# e imprime el resultado como JSON en la ultima linea de stdout.
+PROFILE_SCRIPT = '''
+import json, os, sys, time
+start = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', %(settings)r)
+
+import django
+from django.apps import AppConfig
+
+ready_times = {}
+register_stats = {'calls': 0, 'seconds': 0.0}
+
+def patch_auditlog_register():
+    # auditlog.registry solo se puede importar con los modelos ya cargados
+    from auditlog.registry import AuditlogModelRegistry
+
+    original_register = AuditlogModelRegistry.register
+
+    def register(self, *args, **kwargs):
+        register_start = time.perf_counter()
+        try:
+            return original_register(self, *args, **kwargs)
+        finally:
+            register_stats['calls'] += 1
+            register_stats['seconds'] += time.perf_counter() - register_start
+
+    AuditlogModelRegistry.register = register
+
+original_create = AppConfig.create.__func__
+
+def create(cls, entry):
+    config = original_create(cls, entry)
+    ready = config.ready
+
+    def timed_ready():
+        if not ready_times:
+            patch_auditlog_register()
+        ready_start = time.perf_counter()
+        ready()
+        ready_times[config.label] = time.perf_counter() - ready_start
+
+    config.ready = timed_ready
+    return config
+
+AppConfig.create = classmethod(create)
+
+setup_start = time.perf_counter()
+django.setup()
+setup_end = time.perf_counter()
+
+from auditlog.registry import auditlog
+
+print(json.dumps({
+    'total': setup_end - start,
+    'setup': setup_end - setup_start,
+    'ready': ready_times,
+    'auditlog_register': register_stats,
+    'auditlog_models': len(auditlog.get_models()),
+}))
+'''
+
+
+class Command(BaseCommand):
+    help = 'Mide el arranque en frio de un worker: ready() por app, imports y registro de auditlog'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Arranques a medir, se reporta el mas rapido (default: 3)'
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='Cantidad de modulos mas lentos a mostrar (default: 20)'
+        )
+
+    def handle(self, *args, **options):
+        script = PROFILE_SCRIPT % {'settings': os.environ['DJANGO_SETTINGS_MODULE']}
+        best = None
+        for _ in range(options['runs']):
+            result = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', script],
+                cwd=settings.BASE_DIR,
+                capture_output=True,
+                text=True,
+            )
+            if result.returncode != 0:
+                errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+                self.stderr.write('\n'.join(errors))
+                return
+
+            report = json.loads(result.stdout.strip().splitlines()[-1])
+            report['imports'] = self.parse_importtime(result.stderr)
+            if best is None or report['total'] < best['total']:
+                best = report
+
+        self.print_report(best, options['top'])
+
+    def parse_importtime(self, output):
+        """Lineas 'import time: self [us] | cumulative | modulo' -> {modulo: (self, cumulative)}."""
+        imports = {}
+        for line in output.splitlines():
+            if not line.startswith('import time:') or 'self [us]' in line:
+                continue
+            self_us, cumulative_us, module = line[len('import time:'):].split('|')
+            imports[module.strip()] = (int(self_us) / 1e6, int(cumulative_us) / 1e6)
+        return imports
+
+    def print_report(self, report, top):
+        self.stdout.write(self.style.MIGRATE_HEADING('Arranque'))
+        self.stdout.write(f'  Total (imports + django.setup): {report["total"] * 1000:8.1f} ms')
+        self.stdout.write(f'  django.setup():                 {report["setup"] * 1000:8.1f} ms')
+
+        self.stdout.write(self.style.MIGRATE_HEADING('ready() por app'))
+        for label, seconds in sorted(report['ready'].items(), key=lambda item: -item[1]):
+            self.stdout.write(f'  {label:<30} {seconds * 1000:8.2f} ms')
+
+        register = report['auditlog_register']
+        self.stdout.write(self.style.MIGRATE_HEADING('Registro de auditlog'))
+        self.stdout.write(f'  Modelos registrados:            {report["auditlog_models"]:8d}')
+        self.stdout.write(f'  Llamadas a register():          {register["calls"]:8d}')
+        self.stdout.write(f'  Tiempo en register():           {register["seconds"] * 1000:8.2f} ms')
+
+        self.stdout.write(self.style.MIGRATE_HEADING(f'Imports mas lentos (acumulado, top {top})'))
+        imports = sorted(report['imports'].items(), key=lambda item: -item[1][1])[:top]
+        for module, (self_seconds, cumulative_seconds) in imports:
+            self.stdout.write(
+                f'  {module:<50} {cumulative_seconds * 1000:8.2f} ms (propio {self_seconds * 1000:.2f} ms)'
+            )
@@ -0,0 +1,69 @@
+from datetime import timedelta
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+from inventory.models import Category, Product, Customer, Supplier
+
+
+class Command(BaseCommand):
+    help = 'Elimina fisicamente los registros borrados logicamente, por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--older-than-days',
+            type=int,
+            default=30,
+            help='Solo registros borrados hace mas de N dias (default: 30)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Registros por lote (default: 500)'
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=0.5,
+            help='Segundos de pausa entre lotes (default: 0.5)'
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=0,
+            help='Maximo de lotes por modelo, 0 = sin limite (default: 0)'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+
+        # Productos antes que categorias (Product.category es PROTECT)
+        for model in (Product, Supplier, Customer, Category):
+            queryset = model.all_objects.filter(deleted_at__lt=cutoff)
+            if model is Category:
+                # Una categoria solo se purga cuando ya no tiene productos (ni borrados)
+                queryset = queryset.filter(
+                    ~Exists(Product.all_objects.filter(category=OuterRef('pk')))
+                )
+
+            total = self.purge(queryset, options)
+            self.stdout.write(self.style.SUCCESS(
+                f'{model._meta.label}: {total} eliminados'
+            ))
+
+    def purge(self, queryset, options):
+        total = 0
+        batches = 0
+        while True:
+            ids = list(queryset.order_by('pk').values_list('pk', flat=True)[:options['batch_size']])
+            if not ids:
+                return total
+
+            queryset.model.all_objects.filter(pk__in=ids).hard_delete()
+            total += len(ids)
+            batches += 1
+            if options['max_batches'] and batches >= options['max_batches']:
+                return total
+            time.sleep(options['sleep'])
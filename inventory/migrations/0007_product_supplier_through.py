@@ -0,0 +1,61 @@
+# Generated by Django 5.2 on 2026-10-18 23:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_supplier_count(apps, schema_editor):
+    Product = apps.get_model('inventory', 'Product')
+    ProductSupplier = apps.get_model('inventory', 'ProductSupplier')
+    counts = (
+        ProductSupplier.objects.filter(product=OuterRef('pk'))
+        .values('product')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Product.objects.update(supplier_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0006_customer'),
+    ]
+
+    operations = [
+        # La tabla inventory_product_suppliers ya existe (creada por el M2M automatico):
+        # solo se actualiza el estado para usar el modelo ProductSupplier explicito.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='ProductSupplier',
+                    fields=[
+                        ('id', models.AutoField(primary_key=True, serialize=False)),
+                        ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='inventory.product')),
+                        ('supplier', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='inventory.supplier')),
+                    ],
+                    options={
+                        'db_table': 'inventory_product_suppliers',
+                        'unique_together': {('product', 'supplier')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='product',
+                    name='suppliers',
+                    field=models.ManyToManyField(blank=True, related_name='products', through='inventory.ProductSupplier', to='inventory.supplier'),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='productsupplier',
+            index=models.Index(fields=['supplier', 'product'], name='inventory_ps_supplier_idx'),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='supplier_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_supplier_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-18 23:39
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+from django.utils import timezone
+
+
+def soft_delete_duplicate_emails(apps, schema_editor):
+    # Antes de la restriccion: por cada email repetido se conserva el cliente mas reciente
+    Customer = apps.get_model('inventory', 'Customer')
+    duplicates = (
+        Customer.objects.filter(deleted_at__isnull=True)
+        .values('email')
+        .annotate(total=Count('id'), keep=Max('id'))
+        .filter(total__gt=1)
+    )
+    now = timezone.now()
+    for row in duplicates.iterator():
+        Customer.objects.filter(email=row['email'], deleted_at__isnull=True).exclude(
+            pk=row['keep']
+        ).update(deleted_at=now)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_soft_delete'),
+    ]
+
+    operations = [
+        migrations.RunPython(soft_delete_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customer',
+            constraint=models.UniqueConstraint(condition=models.Q(('deleted_at__isnull', True)), fields=('email',), name='inventory_customer_email_alive_uniq'),
+        ),
+    ]
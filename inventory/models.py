@@ -1,39 +1,173 @@
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 
-class Category(models.Model):
+
+class SoftDeleteQuerySet(models.QuerySet):
+    def delete(self):
+        """
+        Borrado logico en bloque (un solo UPDATE, sin signals).
+        Devuelve (total, {label: total}) igual que QuerySet.delete().
+        """
+        count = self.update(deleted_at=timezone.now())
+        return count, {self.model._meta.label: count}
+
+    def hard_delete(self):
+        return super().delete()
+
+    def alive(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def dead(self):
+        return self.filter(deleted_at__isnull=False)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
+    """Manager por defecto: excluye los registros borrados logicamente."""
+
+    def get_queryset(self):
+        return super().get_queryset().alive()
+
+
+class SoftDeleteModel(models.Model):
+    """
+    Modelo con borrado logico: delete() marca deleted_at en lugar de borrar la fila.
+    `objects` solo devuelve registros vivos, `all_objects` incluye los borrados.
+    Los borrados se eliminan fisicamente con el comando purge_deleted.
+    """
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+
+    objects = SoftDeleteManager()
+    all_objects = SoftDeleteQuerySet.as_manager()
+
+    class Meta:
+        abstract = True
+        indexes = [
+            # Indice parcial: los listados (deleted_at IS NULL) no crecen con los borrados
+            models.Index(
+                fields=['id'],
+                condition=Q(deleted_at__isnull=True),
+                name='%(app_label)s_%(class)s_alive_idx',
+            ),
+        ]
+
+    def delete(self, using=None, keep_parents=False):
+        """Borrado logico. Devuelve (1, {label: 1}) como Model.delete()."""
+        self.deleted_at = timezone.now()
+        self.save(using=using, update_fields=['deleted_at'])
+        return 1, {self._meta.label: 1}
+
+    def hard_delete(self, using=None, keep_parents=False):
+        return super().delete(using=using, keep_parents=keep_parents)
+
+    def restore(self):
+        self.deleted_at = None
+        self.save(update_fields=['deleted_at'])
+
+
+class CategoryQuerySet(SoftDeleteQuerySet):
+    def delete(self):
+        # Misma proteccion que Category.delete para el borrado en bloque (admin, API)
+        if Product.objects.filter(category__in=self).exists():
+            raise models.ProtectedError(
+                'No se puede eliminar la categoria: tiene productos asociados', set()
+            )
+        return super().delete()
+
+
+class Category(SoftDeleteModel):
     name = models.CharField(max_length=100)
 
+    objects = SoftDeleteManager.from_queryset(CategoryQuerySet)()
+    all_objects = CategoryQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
+    def delete(self, using=None, keep_parents=False):
+        # Equivalente a on_delete=PROTECT para productos vivos, sin pasar por el Collector
+        if Product.objects.db_manager(using).filter(category=self).exists():
+            raise models.ProtectedError(
+                'No se puede eliminar la categoria: tiene productos asociados', set()
+            )
+        return super().delete(using=using, keep_parents=keep_parents)
 
-class Product(models.Model):
+
+class Product(SoftDeleteModel):
     name = models.CharField(max_length=100)
     category = models.ForeignKey(Category, on_delete=models.PROTECT)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     stock = models.PositiveIntegerField()
-    suppliers = models.ManyToManyField('Supplier', blank=True, related_name='products')
+    suppliers = models.ManyToManyField('Supplier', blank=True, related_name='products', through='ProductSupplier')
+    # Precalculado por inventory.signals al cambiar la relacion con proveedores
+    supplier_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name
 
 
-class Supplier(models.Model):
+class SupplierQuerySet(SoftDeleteQuerySet):
+    def delete(self):
+        # El UPDATE no envia post_save: recalcular aqui el contador de los productos
+        from inventory.signals import refresh_supplier_count
+
+        supplier_ids = list(self.values_list('pk', flat=True))
+        result = super().delete()
+        refresh_supplier_count(list(
+            ProductSupplier.objects.filter(supplier__in=supplier_ids)
+            .values_list('product_id', flat=True).distinct()
+        ))
+        return result
+
+
+class Supplier(SoftDeleteModel):
     name = models.CharField(max_length=100)
     email = models.EmailField()
     phone = models.CharField(max_length=20)
     address = models.TextField(blank=True)
     contact_person = models.CharField(max_length=100, blank=True)
 
+    objects = SoftDeleteManager.from_queryset(SupplierQuerySet)()
+    all_objects = SupplierQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
 
-class Customer(models.Model):
+class ProductSupplier(models.Model):
+    """Tabla intermedia de Product.suppliers (misma tabla que la generada por Django)."""
+    id = models.AutoField(primary_key=True)
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    supplier = models.ForeignKey(Supplier, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'inventory_product_suppliers'
+        unique_together = [('product', 'supplier')]
+        indexes = [
+            # Busqueda de productos por proveedor (/api/suppliers/{id}/products/)
+            models.Index(fields=['supplier', 'product'], name='inventory_ps_supplier_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} - {self.supplier_id}"
+
+
+class Customer(SoftDeleteModel):
     name = models.CharField(max_length=100)
+    # Sin db_index: el indice unico parcial (clientes vivos) sirve las busquedas por email
     email = models.EmailField()
     phone = models.CharField(max_length=20)
     address = models.TextField(blank=True)
 
+    class Meta(SoftDeleteModel.Meta):
+        constraints = [
+            # Un solo cliente vivo por email (upsert de /api/customers/bulk/)
+            models.UniqueConstraint(
+                fields=['email'],
+                condition=Q(deleted_at__isnull=True),
+                name='inventory_customer_email_alive_uniq',
+            ),
+        ]
+
     def __str__(self):
         return self.name
@@ -1,26 +1,85 @@
 from rest_framework import serializers
-from .models import Category, Product, Supplier
+from rest_framework.permissions import SAFE_METHODS
+from .models import Category, Product, Supplier, Customer
 
 
-class CategorySerializer(serializers.ModelSerializer):
+def parse_list_param(request, name):
+    """Lee un query param separado por comas (?fields=id,name). None si no viene."""
+    value = request.query_params.get(name)
+    if value is None:
+        return None
+    return {item.strip() for item in value.split(',') if item.strip()}
+
+
+class SparseFieldsMixin:
+    """
+    Recorta los campos de la respuesta segun ?fields= y ?expand=.
+
+    - ?fields=id,name  devuelve solo esos campos.
+    - ?expand=x        agrega campos de Meta.expandable_fields (relaciones).
+    Un campo desconocido (o ?fields= vacio) responde 400.
+    Si se usa ?fields= los campos expandibles no se incluyen salvo que se
+    pidan en fields o expand. Solo aplica a lecturas (GET/HEAD/OPTIONS).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return
+
+        requested = parse_list_param(request, 'fields')
+        if requested is None:
+            return
+        if not requested:
+            raise serializers.ValidationError({'fields': ['Debe indicar al menos un campo.']})
+        unknown = requested - set(self.fields)
+        if unknown:
+            raise serializers.ValidationError({
+                'fields': [f'Campos desconocidos: {", ".join(sorted(unknown))}.']
+            })
+
+        expand = parse_list_param(request, 'expand') or set()
+        requested |= expand & set(getattr(self.Meta, 'expandable_fields', ()))
+        for name in set(self.fields) - requested:
+            self.fields.pop(name)
+
+
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
-        fields = '__all__'
+        exclude = ['deleted_at']
 
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
+    # Declarado explicitamente: DRF deja en solo lectura los M2M con modelo intermedio
+    suppliers = serializers.PrimaryKeyRelatedField(many=True, required=False, queryset=Supplier.objects.all())
     suppliers_detail = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = Product
-        fields = ['id', 'name', 'category', 'category_name', 'price', 'stock', 'suppliers', 'suppliers_detail']
+        fields = ['id', 'name', 'category', 'category_name', 'price', 'stock', 'suppliers', 'suppliers_detail', 'supplier_count']
+        read_only_fields = ['supplier_count']
+        expandable_fields = ['category_name', 'suppliers_detail']
 
     def get_suppliers_detail(self, obj):
         return [{'id': s.id, 'name': s.name} for s in obj.suppliers.all()]
 
 
-class SupplierSerializer(serializers.ModelSerializer):
+class SupplierSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Supplier
-        fields = '__all__'
\ No newline at end of file
+        exclude = ['deleted_at']
+
+
+class CustomerSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Customer
+        exclude = ['deleted_at']
+
+
+class CustomerBulkSerializer(CustomerSerializer):
+    # Declarado sin UniqueValidator: en el upsert un email existente se actualiza
+    email = serializers.EmailField(max_length=254)
@@ -0,0 +1,84 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from inventory.models import Product, ProductSupplier, Supplier
+
+
+def refresh_supplier_count(product_ids):
+    """Recalcula Product.supplier_count con un solo UPDATE."""
+    if not product_ids:
+        return
+    counts = (
+        ProductSupplier.objects.filter(product=OuterRef('pk'), supplier__deleted_at__isnull=True)
+        .values('product')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Product.all_objects.filter(pk__in=product_ids).update(
+        supplier_count=Coalesce(Subquery(counts), 0)
+    )
+
+
+def refresh_product_supplier_count(product):
+    """Recalcula el contador de un producto y actualiza tambien la instancia en memoria."""
+    product.supplier_count = ProductSupplier.objects.filter(
+        product=product, supplier__deleted_at__isnull=True
+    ).count()
+    Product.all_objects.filter(pk=product.pk).update(supplier_count=product.supplier_count)
+
+
+def product_suppliers_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('pre_clear', 'post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        # product.suppliers.add/remove/set/clear
+        if action != 'pre_clear':
+            refresh_product_supplier_count(instance)
+    elif action == 'pre_clear':
+        # supplier.products.clear(): guardar los productos afectados antes de borrar
+        instance._cleared_product_ids = list(
+            ProductSupplier.objects.filter(supplier=instance).values_list('product_id', flat=True)
+        )
+    elif action == 'post_clear':
+        refresh_supplier_count(getattr(instance, '_cleared_product_ids', None))
+    else:
+        refresh_supplier_count(pk_set)
+
+
+def supplier_pre_delete(sender, instance, **kwargs):
+    # El CASCADE sobre la tabla intermedia no envia m2m_changed
+    instance._cleared_product_ids = list(
+        ProductSupplier.objects.filter(supplier=instance).values_list('product_id', flat=True)
+    )
+
+
+def supplier_post_delete(sender, instance, **kwargs):
+    refresh_supplier_count(getattr(instance, '_cleared_product_ids', None))
+
+
+def supplier_soft_deleted(sender, instance, update_fields, **kwargs):
+    # Borrado logico o restauracion de un proveedor (SoftDeleteModel.delete/restore)
+    if update_fields and 'deleted_at' in update_fields:
+        refresh_supplier_count(
+            list(ProductSupplier.objects.filter(supplier=instance).values_list('product_id', flat=True))
+        )
+
+
+def product_supplier_saved(sender, instance, raw=False, **kwargs):
+    # Filas guardadas directamente (inline del admin, ProductSupplier.objects.create):
+    # no envian m2m_changed
+    if not raw:
+        refresh_supplier_count([instance.product_id])
+
+
+def product_supplier_deleted(sender, instance, **kwargs):
+    refresh_supplier_count([instance.product_id])
+
+
+m2m_changed.connect(product_suppliers_changed, sender=ProductSupplier)
+post_save.connect(product_supplier_saved, sender=ProductSupplier)
+post_delete.connect(product_supplier_deleted, sender=ProductSupplier)
+pre_delete.connect(supplier_pre_delete, sender=Supplier)
+post_delete.connect(supplier_post_delete, sender=Supplier)
+post_save.connect(supplier_soft_deleted, sender=Supplier)
@@ -1,3 +1,315 @@
-from django.test import TestCase
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.db.models import ProtectedError
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from audit.models import AuditModelConfig
+from inventory.models import Category, Customer, Product, ProductSupplier, Supplier
+from store.throttling import CacheBucketStore, LocalBucketStore
+
+
+def make_product(category, name='P'):
+    return Product.objects.create(name=name, category=category, price='1.00', stock=1)
+
+
+def make_supplier(name='S'):
+    return Supplier.objects.create(name=name, email=f'{name.lower()}@example.com', phone='1')
+
+
+class SupplierCountTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='C')
+        self.product = make_product(self.category)
+        self.supplier = make_supplier()
+
+    def supplier_count(self):
+        return Product.all_objects.get(pk=self.product.pk).supplier_count
+
+    def test_m2m_add_and_remove(self):
+        self.product.suppliers.add(self.supplier)
+        self.assertEqual(self.supplier_count(), 1)
+
+        self.product.suppliers.remove(self.supplier)
+        self.assertEqual(self.supplier_count(), 0)
+
+    def test_through_rows_saved_directly(self):
+        # Como lo hace el inline del admin: sin m2m_changed
+        link = ProductSupplier.objects.create(product=self.product, supplier=self.supplier)
+        self.assertEqual(self.supplier_count(), 1)
+
+        link.delete()
+        self.assertEqual(self.supplier_count(), 0)
+
+    def test_supplier_soft_delete_and_restore(self):
+        self.product.suppliers.add(self.supplier)
+
+        self.supplier.delete()
+        self.assertEqual(self.supplier_count(), 0)
+
+        self.supplier.restore()
+        self.assertEqual(self.supplier_count(), 1)
+
+    def test_supplier_queryset_delete(self):
+        # Accion "eliminar seleccionados" del admin: delete_queryset -> QuerySet.delete
+        self.product.suppliers.add(self.supplier, make_supplier('T'))
+
+        Supplier.objects.filter(pk=self.supplier.pk).delete()
+        self.assertEqual(self.supplier_count(), 1)
+
+    def test_stale_count_is_recomputed(self):
+        self.product.suppliers.add(self.supplier)
+        Product.all_objects.filter(pk=self.product.pk).update(supplier_count=7)
+
+        self.product.suppliers.add(make_supplier('T'))
+        self.assertEqual(self.supplier_count(), 2)
+
+
+class SoftDeleteTests(TestCase):
+    def setUp(self):
+        self.category = Category.objects.create(name='C')
+        self.product = make_product(self.category)
+
+    def test_delete_marks_deleted_at(self):
+        self.assertEqual(self.product.delete(), (1, {'inventory.Product': 1}))
+
+        self.assertFalse(Product.objects.filter(pk=self.product.pk).exists())
+        self.assertIsNotNone(Product.all_objects.get(pk=self.product.pk).deleted_at)
+
+    def test_queryset_delete_returns_django_tuple(self):
+        make_product(self.category, 'P2')
+
+        result = Product.objects.filter(category=self.category).delete()
+
+        self.assertEqual(result, (2, {'inventory.Product': 2}))
+        self.assertFalse(Product.objects.exists())
+        self.assertEqual(Product.all_objects.count(), 2)
+
+    def test_category_with_live_products_is_protected(self):
+        with self.assertRaises(ProtectedError):
+            self.category.delete()
+        with self.assertRaises(ProtectedError):
+            Category.objects.filter(pk=self.category.pk).delete()
+
+        self.assertTrue(Category.objects.filter(pk=self.category.pk).exists())
+
+    def test_category_with_only_deleted_products_can_be_deleted(self):
+        self.product.delete()
+
+        Category.objects.filter(pk=self.category.pk).delete()
+
+        self.assertFalse(Category.objects.filter(pk=self.category.pk).exists())
+
+    def test_purge_deleted(self):
+        other = Category.objects.create(name='Vacia')
+        self.product.delete()
+        self.category.delete()
+        other.delete()
+
+        call_command('purge_deleted', older_than_days=0, sleep=0, stdout=StringIO())
+
+        self.assertFalse(Product.all_objects.filter(pk=self.product.pk).exists())
+        self.assertFalse(Category.all_objects.filter(pk=other.pk).exists())
+        # Purgada en la misma pasada porque sus productos se purgan antes
+        self.assertFalse(Category.all_objects.filter(pk=self.category.pk).exists())
+
+    def test_purge_keeps_recent_rows(self):
+        self.product.delete()
+
+        call_command('purge_deleted', older_than_days=30, sleep=0, stdout=StringIO())
+
+        self.assertTrue(Product.all_objects.filter(pk=self.product.pk).exists())
+
+
+class ThrottlingTests(TestCase):
+    def setUp(self):
+        patcher = mock.patch('store.throttling._local_store', LocalBucketStore())
+        self.store = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('u', password='p'))
+
+    def test_local_bucket_burst_and_refill(self):
+        results = [self.store.consume('k', 2, 1.0, now=100.0)[0] for _ in range(3)]
+        self.assertEqual(results, [True, True, False])
+
+        self.assertTrue(self.store.consume('k', 2, 1.0, now=101.0)[0])
+
+    @override_settings(THROTTLE_BUCKETS={'inventory': {'burst': 2, 'sustained': '1/min'}})
+    def test_api_returns_429_with_retry_after(self):
+        statuses = [self.client.get('/api/categories/').status_code for _ in range(3)]
+
+        self.assertEqual(statuses, [200, 200, 429])
+        response = self.client.get('/api/categories/')
+        self.assertIn('Retry-After', response)
+        self.assertEqual(self.store.stats(), {'inventory:allowed': 2, 'inventory:throttled': 2})
+
+    def test_cache_store_burst_and_sliding_window(self):
+        store = CacheBucketStore()
+        self.addCleanup(cache.clear)
+
+        # capacidad 2, 1 token/s: ventanas de 2 s
+        results = [store.consume('k', 2, 1.0, now=100.0)[0] for _ in range(3)]
+        self.assertEqual(results, [True, True, False])
+
+        # A mitad de la ventana siguiente la anterior pesa la mitad: 1 lugar libre
+        results = [store.consume('k', 2, 1.0, now=103.0)[0] for _ in range(2)]
+        self.assertEqual(results, [True, False])
+
+    def test_cache_store_parallel_requests_within_burst(self):
+        store = CacheBucketStore()
+        self.addCleanup(cache.clear)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda _: store.consume('k', 10, 1.0, now=100.0)[0], range(16)
+            ))
+
+        self.assertEqual(results.count(True), 10)
+
+class CustomerBulkUpsertTests(TestCase):
+    url = '/api/customers/bulk/'
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('u', password='p'))
+        self.payload = [
+            {'name': 'Maria', 'email': 'maria@example.com', 'phone': '1'},
+            {'name': 'Jose', 'email': 'jose@example.com', 'phone': '2', 'address': 'Av. 2'},
+        ]
+
+    def test_creates_then_updates(self):
+        response = self.client.post(self.url, self.payload, format='json')
+        self.assertEqual((response.data['created'], response.data['updated']), (2, 0))
+
+        self.payload[0]['name'] = 'Maria Lopez'
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual((response.data['created'], response.data['updated']), (0, 2))
+        self.assertEqual(Customer.objects.count(), 2)
+        self.assertEqual(Customer.objects.get(email='maria@example.com').name, 'Maria Lopez')
+        # address no enviado: se conserva
+        self.assertEqual(Customer.objects.get(email='jose@example.com').address, 'Av. 2')
+
+    def test_audited_path_updates_without_duplicates(self):
+        AuditModelConfig.objects.filter(content_type__model='customer').update(is_active=True)
+
+        self.client.post(self.url, self.payload, format='json')
+        response = self.client.post(self.url, self.payload, format='json')
+
+        self.assertEqual((response.data['created'], response.data['updated']), (0, 2))
+        self.assertEqual(Customer.objects.count(), 2)
+
+    def test_repeated_email_in_request_keeps_last(self):
+        payload = self.payload + [{'name': 'Maria 2', 'email': 'maria@example.com', 'phone': '3'}]
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(Customer.objects.get(email='maria@example.com').name, 'Maria 2')
+
+    def test_deleted_customer_does_not_block_email(self):
+        Customer.objects.create(name='Antigua', email='maria@example.com', phone='0').delete()
+
+        response = self.client.post(self.url, self.payload[:1], format='json')
+
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual(Customer.all_objects.filter(email='maria@example.com').count(), 2)
+
+    def test_live_email_is_unique(self):
+        Customer.objects.create(name='A', email='maria@example.com', phone='1')
+        with self.assertRaises(IntegrityError):
+            Customer.objects.create(name='B', email='maria@example.com', phone='2')
+
+    def test_too_many_rows(self):
+        payload = [{'name': 'C', 'email': f'c{i}@example.com', 'phone': '1'} for i in range(1001)]
+
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Customer.objects.exists())
+
+
+class SparseFieldsTests(TestCase):
+    def read_json(self, response):
+        return json.loads(b''.join(response.streaming_content))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user('u', password='p'))
+        make_supplier()
+        Customer.objects.create(name='Maria', email='maria@example.com', phone='1')
+
+    def test_requested_fields_only(self):
+        response = self.client.get('/api/suppliers/?fields=id,name')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(self.read_json(response)[0]), {'id', 'name'})
+
+    def test_unknown_field_is_rejected(self):
+        for url in ('/api/suppliers/', '/api/customers/', '/api/customers/export/'):
+            with self.subTest(url=url):
+                response = self.client.get(url, {'fields': 'id,bogus'})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('bogus', response.json()['fields'][0])
+
+    def test_empty_fields_is_rejected(self):
+        response = self.client.get('/api/customers/export/', {'fields': ''})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_requested_fields(self):
+        response = self.client.get('/api/customers/export/', {'fields': 'email'})
+
+        self.assertEqual(self.read_json(response), [{'email': 'maria@example.com'}])
+
+
+class SoftDeleteAdminTests(TestCase):
+    def setUp(self):
+        self.client.force_login(User.objects.create_superuser('admin', password='p'))
+        self.category = Category.objects.create(name='C')
+        self.product = make_product(self.category)
+
+    def test_category_with_only_deleted_products(self):
+        self.product.delete()
+        url = f'/admin/inventory/category/{self.category.pk}/delete/'
+
+        self.assertFalse(self.client.get(url).context['protected'])
+        response = self.client.post(url, {'post': 'yes'})
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Category.objects.filter(pk=self.category.pk).exists())
+        self.assertTrue(Category.all_objects.filter(pk=self.category.pk).exists())
+
+    def test_category_with_live_products_is_protected(self):
+        response = self.client.get(f'/admin/inventory/category/{self.category.pk}/delete/')
+
+        self.assertEqual(response.context['protected'], ['Product: P'])
+
+    def test_supplier_delete_page_keeps_through_rows(self):
+        supplier = make_supplier()
+        self.product.suppliers.add(supplier)
+        url = f'/admin/inventory/supplier/{supplier.pk}/delete/'
+
+        self.assertEqual(dict(self.client.get(url).context['model_count']), {'suppliers': 1})
+        self.client.post(url, {'post': 'yes'})
+
+        self.assertTrue(ProductSupplier.objects.filter(supplier=supplier).exists())
+        self.assertEqual(Product.objects.get(pk=self.product.pk).supplier_count, 0)
+
+    def test_delete_selected_action(self):
+        self.product.delete()
+
+        self.client.post('/admin/inventory/category/', {
+            'action': 'delete_selected', '_selected_action': [self.category.pk], 'post': 'yes',
+        })
+
+        self.assertFalse(Category.objects.filter(pk=self.category.pk).exists())
@@ -1,12 +1,19 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import CategoryViewSet, ProductViewSet, SupplierViewSet
+from .views import CategoryViewSet, ProductViewSet, SupplierViewSet, CustomerViewSet, KeysetPagination
 
 router = DefaultRouter()
 router.register(r'categories', CategoryViewSet)
 router.register(r'products', ProductViewSet)
 router.register(r'suppliers', SupplierViewSet)
+router.register(r'customers', CustomerViewSet)
+
+supplier_products = ProductViewSet.as_view(
+    {'get': 'list'},
+    pagination_class=KeysetPagination,
+)
 
 urlpatterns = [
+    path('suppliers/<int:supplier_pk>/products/', supplier_products, name='supplier-products'),
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,12 +1,118 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, ProtectedError
+from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.response import Response
-from .models import Category, Product, Supplier
-from .serializers import CategorySerializer, ProductSerializer, SupplierSerializer
+from audit.models import AuditModelConfig
+from store.renderers import STREAM_CHUNK_SIZE, StreamingJSONResponse
+from .models import Category, Product, Supplier, Customer
+from .serializers import (
+    CategorySerializer, ProductSerializer, SupplierSerializer, CustomerSerializer, CustomerBulkSerializer,
+)
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class SparseQuerysetMixin:
+    """
+    Ajusta el queryset a los campos pedidos por el serializer (?fields=/?expand=).
+    Los campos de la respuesta los recorta SparseFieldsMixin (serializers.py).
+
+    - Solo se cargan las columnas necesarias (.only()).
+    - select_related/prefetch_related solo si se pide el campo relacionado.
+    - Los listados cuyos campos salen directo de columnas usan values_list()
+      y se envian como JSON por bloques sin pasar por los fields de DRF.
+    """
+
+    # campo del serializer -> columnas para .only() (por defecto el mismo nombre)
+    field_columns = {}
+    # campo del serializer -> ruta de select_related
+    field_select_related = {}
+    # campo del serializer -> Prefetch
+    field_prefetch = {}
+    # campo del serializer -> ruta para values_list() (por defecto su columna)
+    field_values = {}
+
+    def get_requested_fields(self):
+        return list(self.get_serializer().fields)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+
+        requested = self.get_requested_fields()
+        columns = {'pk'}
+        select_related = set()
+        prefetch = {}
+        for name in requested:
+            columns.update(self.field_columns.get(name, (name,)))
+            if name in self.field_select_related:
+                select_related.add(self.field_select_related[name])
+            if name in self.field_prefetch:
+                lookup = self.field_prefetch[name]
+                prefetch[lookup.prefetch_through] = lookup
+
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch.values())
+        return queryset.only(*columns)
+
+    def get_values_paths(self, requested):
+        """Rutas de values_list() para los campos pedidos, o None si alguno no aplica."""
+        model = self.queryset.model
+        paths = []
+        for name in requested:
+            if name in self.field_values:
+                paths.append(self.field_values[name])
+                continue
+            if name in self.field_prefetch:
+                return None
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.many_to_many:
+                return None
+            paths.append(field.attname)
+        # values_list() sin rutas seleccionaria todas las columnas
+        return paths or None
+
+    def list(self, request, *args, **kwargs):
+        if self.paginator is not None or request.accepted_renderer.format != 'json':
+            return super().list(request, *args, **kwargs)
+
+        requested = self.get_requested_fields()
+        paths = self.get_values_paths(requested)
+        if paths is None:
+            return super().list(request, *args, **kwargs)
+
+        return self.stream_values(self.filter_queryset(self.get_queryset()), requested, paths)
+
+    def stream_values(self, queryset, requested, paths):
+        if paths is None:
+            # Algun campo no sale de una columna: se serializa fila por fila
+            objects = queryset.iterator(chunk_size=STREAM_CHUNK_SIZE)
+            return StreamingJSONResponse(self.get_serializer(obj).data for obj in objects)
+        rows = queryset.values_list(*paths).iterator(chunk_size=STREAM_CHUNK_SIZE)
+        return StreamingJSONResponse(dict(zip(requested, row)) for row in rows)
+
+
+class KeysetPagination(CursorPagination):
+    """Paginacion por cursor/keyset sobre id (sin COUNT ni OFFSET)."""
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+    ordering = 'id'
+
+
+class CategoryViewSet(SparseQuerysetMixin, viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
+    throttle_scope = 'inventory'
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -30,15 +136,42 @@ class CategoryViewSet(viewsets.ModelViewSet):
 
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
-        self.perform_destroy(instance)
+        try:
+            self.perform_destroy(instance)
+        except ProtectedError:
+            return Response({
+                'message': 'No se puede eliminar la categoría: tiene productos asociados'
+            }, status=status.HTTP_409_CONFLICT)
         return Response({
             'message': 'Categoría eliminada exitosamente'
         }, status=status.HTTP_200_OK)
 
 
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(SparseQuerysetMixin, viewsets.ModelViewSet):
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
+    throttle_scope = 'products'
+    field_columns = {
+        'category_name': ('category', 'category__name'),
+        'suppliers': (),
+        'suppliers_detail': (),
+    }
+    field_select_related = {'category_name': 'category'}
+    suppliers_prefetch = Prefetch('suppliers', queryset=Supplier.objects.only('id', 'name'))
+    field_prefetch = {
+        'suppliers': suppliers_prefetch,
+        'suppliers_detail': suppliers_prefetch,
+    }
+    field_values = {'category_name': 'category__name'}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # /api/suppliers/{supplier_pk}/products/
+        supplier_pk = self.kwargs.get('supplier_pk')
+        if supplier_pk is not None:
+            get_object_or_404(Supplier.objects.only('id'), pk=supplier_pk)
+            queryset = queryset.filter(suppliers=supplier_pk)
+        return queryset
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -68,9 +201,10 @@ class ProductViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_200_OK)
 
 
-class SupplierViewSet(viewsets.ModelViewSet):
+class SupplierViewSet(SparseQuerysetMixin, viewsets.ModelViewSet):
     queryset = Supplier.objects.all()
     serializer_class = SupplierSerializer
+    throttle_scope = 'inventory'
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -97,4 +231,118 @@ class SupplierViewSet(viewsets.ModelViewSet):
         self.perform_destroy(instance)
         return Response({
             'message': 'Proveedor eliminado exitosamente'
-        }, status=status.HTTP_200_OK)
\ No newline at end of file
+        }, status=status.HTTP_200_OK)
+
+
+class CustomerViewSet(SparseQuerysetMixin, viewsets.ModelViewSet):
+    queryset = Customer.objects.all()
+    serializer_class = CustomerSerializer
+    pagination_class = KeysetPagination
+    throttle_scope = 'customers'
+    bulk_max_size = 1000
+    bulk_batch_size = 500
+
+    def get_serializer_class(self):
+        if self.action == 'bulk_upsert':
+            return CustomerBulkSerializer
+        return super().get_serializer_class()
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return Response({
+            'message': 'Cliente creado exitosamente',
+            'data': serializer.data
+        }, status=status.HTTP_201_CREATED)
+
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop('partial', False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+        return Response({
+            'message': 'Cliente actualizado exitosamente',
+            'data': serializer.data
+        })
+
+    def destroy(self, request, *args, **kwargs):
+        instance = self.get_object()
+        self.perform_destroy(instance)
+        return Response({
+            'message': 'Cliente eliminado exitosamente'
+        }, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_upsert(self, request):
+        """
+        Crea o actualiza clientes por email en bloque.
+        Si la auditoria de Customer esta activa (AuditModelConfig) se guarda
+        fila por fila para que auditlog registre cada cambio; si no, se usa
+        bulk_create/bulk_update.
+        """
+        if not isinstance(request.data, list):
+            return Response({
+                'message': 'Se esperaba una lista de clientes'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        if len(request.data) > self.bulk_max_size:
+            return Response({
+                'message': f'Maximo {self.bulk_max_size} clientes por peticion'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        # Si un email se repite en la peticion, gana el ultimo
+        by_email = {item['email']: item for item in serializer.validated_data}
+        audited = AuditModelConfig.is_active_for_model(Customer)
+        try:
+            created, updated = self.upsert_customers(by_email, audited)
+        except IntegrityError:
+            # Otra peticion creo alguno de los emails entre el SELECT y el INSERT
+            # (inventory_customer_email_alive_uniq): ahora existen y se actualizan
+            created, updated = self.upsert_customers(by_email, audited)
+
+        return Response({
+            'message': 'Clientes sincronizados exitosamente',
+            'created': created,
+            'updated': updated,
+        })
+
+    def upsert_customers(self, by_email, audited):
+        # bulk_create(update_conflicts=True) no sirve aqui: el ON CONFLICT de
+        # Django no puede apuntar a un indice unico parcial (solo clientes vivos)
+        fields = ['name', 'phone', 'address']
+        with transaction.atomic():
+            existing = {
+                customer.email: customer
+                for customer in Customer.objects.select_for_update().filter(email__in=list(by_email))
+            }
+            to_create = []
+            to_update = []
+            for email, item in by_email.items():
+                customer = existing.get(email)
+                if customer is None:
+                    to_create.append(Customer(**item))
+                    continue
+                for field in fields:
+                    if field in item:
+                        setattr(customer, field, item[field])
+                to_update.append(customer)
+
+            if audited:
+                for customer in to_create + to_update:
+                    customer.save()
+            else:
+                Customer.objects.bulk_create(to_create, batch_size=self.bulk_batch_size)
+                Customer.objects.bulk_update(to_update, fields, batch_size=self.bulk_batch_size)
+
+        return len(to_create), len(to_update)
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """Exporta todos los clientes como array JSON enviado por bloques."""
+        requested = self.get_requested_fields()
+        queryset = self.filter_queryset(self.get_queryset()).order_by('id')
+        return self.stream_values(queryset, requested, self.get_values_paths(requested))
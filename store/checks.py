@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core import checks
+
+
+# Backends de cache que no se comparten entre procesos
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+# Modulo liviano a proposito: se importa en el arranque sin cargar store.throttling
+@checks.register(checks.Tags.caches)
+def check_throttle_store(app_configs, **kwargs):
+    """THROTTLE_STORE=cache necesita un cache compartido entre workers."""
+    if getattr(settings, 'THROTTLE_STORE', 'local') != 'cache':
+        return []
+    backend = settings.CACHES['default']['BACKEND']
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [checks.Error(
+        f'THROTTLE_STORE=cache con {backend}: los buckets no se comparten entre workers.',
+        hint='Configurar CACHES["default"] con Redis o Memcached.',
+        id='store.E001',
+    )]
@@ -0,0 +1,107 @@
+import decimal
+import json
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils import encoders
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional, se usa la stdlib si no esta instalado
+    orjson = None
+
+
+STREAM_CHUNK_SIZE = 1000
+
+
+class DecimalAsStringEncoder(encoders.JSONEncoder):
+    """Encoder de DRF que mantiene los Decimal como string (igual que los serializers)."""
+
+    def default(self, obj):
+        if isinstance(obj, decimal.Decimal):
+            return str(obj)
+        return super().default(obj)
+
+
+_fallback_encoder = DecimalAsStringEncoder()
+
+
+def _orjson_default(obj):
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    return _fallback_encoder.default(obj)
+
+
+def dumps(data, indent=None):
+    """Serializa a JSON (bytes) con orjson si esta disponible, si no con la stdlib."""
+    if orjson is not None:
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_orjson_default, option=option)
+
+    separators = (',', ': ') if indent else (',', ':')
+    return json.dumps(
+        data, cls=DecimalAsStringEncoder, indent=indent,
+        ensure_ascii=False, separators=separators,
+    ).encode()
+
+
+def iter_json_array(items, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Genera un array JSON por bloques de `chunk_size` elementos,
+    sin construir el string completo en memoria.
+    """
+    yield b'['
+    chunk = []
+    first = True
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            body = dumps(chunk)[1:-1]
+            yield body if first else b',' + body
+            first = False
+            chunk = []
+    if chunk:
+        body = dumps(chunk)[1:-1]
+        yield body if first else b',' + body
+    yield b']'
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """Respuesta que envia un iterable de elementos como array JSON por bloques."""
+
+    def __init__(self, items, chunk_size=STREAM_CHUNK_SIZE, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(iter_json_array(items, chunk_size), **kwargs)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Renderer JSON de alto rendimiento.
+    Usa orjson si esta instalado; Decimal y datetime se codifican de forma nativa.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return dumps(data, indent=indent)
+
+
+class FastJSONParser(JSONParser):
+    """Parser JSON que usa orjson si esta instalado."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
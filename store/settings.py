@@ -60,7 +60,7 @@ MIDDLEWARE = [
 
 ]
 
-AUDITLOG_INCLUDE_ALL_MODELS = True  # Registra todos los modelos automaticamente
+AUDITLOG_INCLUDE_ALL_MODELS = False  # Los registra AuditConfig.ready() (un solo register() por modelo)
 
 ROOT_URLCONF = 'store.urls'
 
@@ -145,7 +145,42 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # Renderer/parser JSON con orjson (opcional, cae a la stdlib si no esta instalado)
+    'DEFAULT_RENDERER_CLASSES': [
+        'store.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'store.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'store.throttling.TokenBucketThrottle',
+    ],
+}
+
+# Throttling por token bucket (por usuario autenticado o por IP)
+# burst: capacidad del bucket, sustained: velocidad de recarga ('N/s', 'N/min', 'N/h', 'N/day')
+# OJO: con THROTTLE_STORE='local' (default) cada worker tiene sus propios buckets en
+# memoria del proceso (no compartida): con N workers cada limite es en realidad N veces
+# el configurado (burst y sustained). Para limites exactos usar THROTTLE_STORE='cache'.
+THROTTLE_BUCKETS = {
+    'inventory': {'burst': 60, 'sustained': '600/min'},
+    'products': {'burst': 60, 'sustained': '600/min'},
+    'customers': {'burst': 30, 'sustained': '300/min'},
+    'token': {'burst': 5, 'sustained': '10/min'},
+    'token_refresh': {'burst': 10, 'sustained': '60/min'},
 }
+# 'local': buckets en memoria de cada worker (limite efectivo = limite x workers)
+# 'cache': compartidos via CACHES; requiere un cache compartido, por ejemplo:
+# CACHES = {
+#     'default': {
+#         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+#         'LOCATION': os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+#     }
+# }
+THROTTLE_STORE = os.getenv('THROTTLE_STORE', 'local')
 
 # JWT Configuration
 SIMPLE_JWT = {
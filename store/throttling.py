@@ -0,0 +1,166 @@
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+LOCAL_MAX_KEYS = 10000
+
+
+def parse_rate(rate):
+    """'600/min' -> tokens por segundo (mismo formato que DRF)."""
+    num, period = rate.split('/')
+    return int(num) / PERIODS[period[0]]
+
+
+def get_bucket_config(scope):
+    """(capacidad, tokens por segundo) del scope, o None si no esta configurado."""
+    config = getattr(settings, 'THROTTLE_BUCKETS', {}).get(scope)
+    if config is None:
+        return None
+    return config['burst'], parse_rate(config['sustained'])
+
+
+class LocalBucketStore:
+    """
+    Buckets en memoria del proceso: cada worker tiene los suyos, asi que el
+    limite efectivo es burst x workers. stats() solo cuenta este worker.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._counters = Counter()
+
+    def consume(self, key, capacity, refill_rate, now):
+        with self._lock:
+            tokens, last, _ = self._buckets.get(key, (capacity, now, None))
+            tokens = min(capacity, tokens + (now - last) * refill_rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now, capacity / refill_rate)
+
+            if len(self._buckets) > LOCAL_MAX_KEYS:
+                self._prune(now)
+        return allowed, tokens
+
+    def _prune(self, now):
+        # Un bucket inactivo mas tiempo del que tarda en llenarse equivale a no tenerlo
+        self._buckets = {
+            key: (tokens, last, idle)
+            for key, (tokens, last, idle) in self._buckets.items()
+            if now - last < idle
+        }
+
+    def incr(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters)
+
+
+class CacheBucketStore:
+    """
+    Buckets en el cache de Django, compartidos entre workers (Redis/Memcached).
+
+    Sin locks: un contador por ventana con cache.incr (atomico). Cada ventana
+    dura lo que tarda el bucket en llenarse (capacidad / recarga) y admite
+    `capacidad` peticiones; la ventana anterior cuenta en proporcion al tiempo
+    que le queda por cubrir (ventana deslizante), asi el cambio de ventana no
+    duplica el burst.
+    """
+
+    prefix = 'throttle'
+
+    def consume(self, key, capacity, refill_rate, now):
+        window = capacity / refill_rate
+        index, offset = divmod(now, window)
+        current_key = f'{self.prefix}:bucket:{key}:{int(index)}'
+        previous_key = f'{self.prefix}:bucket:{key}:{int(index) - 1}'
+        timeout = int(2 * window) + 1
+
+        cache.add(current_key, 0, timeout=timeout)
+        try:
+            count = cache.incr(current_key)
+        except ValueError:  # la clave expiro entre add e incr
+            cache.set(current_key, 1, timeout=timeout)
+            count = 1
+
+        used = cache.get(previous_key, 0) * (1 - offset / window) + count
+        if used > capacity:
+            # Solo se cuentan las peticiones permitidas
+            try:
+                cache.decr(current_key)
+            except ValueError:
+                pass
+            return False, capacity - used + 1
+        return True, capacity - used
+
+    def incr(self, name):
+        key = f'{self.prefix}:stats:{name}'
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key)
+        except ValueError:  # la clave expiro entre add e incr
+            cache.set(key, 1, timeout=None)
+
+    def stats(self):
+        names = [
+            f'{scope}:{result}'
+            for scope in getattr(settings, 'THROTTLE_BUCKETS', {})
+            for result in ('allowed', 'throttled')
+        ]
+        values = cache.get_many([f'{self.prefix}:stats:{name}' for name in names])
+        return {
+            name: values[f'{self.prefix}:stats:{name}']
+            for name in names if f'{self.prefix}:stats:{name}' in values
+        }
+
+
+_local_store = LocalBucketStore()
+
+
+def get_store():
+    if getattr(settings, 'THROTTLE_STORE', 'local') == 'cache':
+        return CacheBucketStore()
+    return _local_store
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Throttle por token bucket, por usuario autenticado o por IP.
+
+    El scope sale de `throttle_scope` de la vista y su configuracion de
+    settings.THROTTLE_BUCKETS ({'burst': N, 'sustained': 'N/periodo'}).
+    Las vistas sin scope configurado no se limitan.
+    """
+
+    def allow_request(self, request, view):
+        self.scope = getattr(view, 'throttle_scope', None)
+        config = get_bucket_config(self.scope) if self.scope else None
+        if config is None:
+            return True
+
+        capacity, self.refill_rate = config
+        if request.user and request.user.is_authenticated:
+            ident = f'user:{request.user.pk}'
+        else:
+            ident = f'ip:{self.get_ident(request)}'
+
+        store = get_store()
+        allowed, self.tokens = store.consume(
+            f'{self.scope}:{ident}', capacity, self.refill_rate, time.time()
+        )
+        store.incr(f'{self.scope}:{"allowed" if allowed else "throttled"}')
+        return allowed
+
+    def wait(self):
+        """Segundos hasta el proximo token (DRF lo envia como Retry-After)."""
+        return (1 - self.tokens) / self.refill_rate
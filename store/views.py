@@ -0,0 +1,23 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+
+from store.throttling import get_store
+
+
+class ThrottledTokenObtainPairView(TokenObtainPairView):
+    throttle_scope = 'token'
+
+
+class ThrottledTokenRefreshView(TokenRefreshView):
+    throttle_scope = 'token_refresh'
+
+
+class ThrottleStatsView(APIView):
+    """Contadores de peticiones permitidas/limitadas por scope (monitoreo)."""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_store().stats())